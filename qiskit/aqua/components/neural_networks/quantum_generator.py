@@ -167,6 +167,9 @@ class QuantumGenerator(GenerativeNetwork):
 
         self._shots = None
         self._discriminator = None
+        # unbound circuits used by get_output, keyed on whether measurements
+        # are attached; only the parameter values change between calls
+        self._circuit_cache = {}  # type: Dict[bool, QuantumCircuit]
         self._ret = {}  # type: Dict[str, Any]
 
     def set_seed(self, seed):
@@ -232,15 +235,24 @@ class QuantumGenerator(GenerativeNetwork):
             list: generated samples, array: sample occurrence in percentage
         """
         instance_shots = quantum_instance.run_config.shots
-        q = QuantumRegister(sum(self._num_qubits), name='q')
-        qc = QuantumCircuit(q)
-        qc.append(self.construct_circuit(params), q)
-        if quantum_instance.is_statevector:
-            pass
-        else:
-            c = ClassicalRegister(sum(self._num_qubits), name='c')
-            qc.add_register(c)
-            qc.measure(q, c)
+        measure = not quantum_instance.is_statevector
+        qc = self._circuit_cache.get(measure)
+        if qc is None:
+            q = QuantumRegister(sum(self._num_qubits), name='q')
+            qc = QuantumCircuit(q)
+            # pylint: disable=protected-access
+            qc.append(self.generator_circuit._var_form.to_instruction(), q)
+            if measure:
+                c = ClassicalRegister(sum(self._num_qubits), name='c')
+                qc.add_register(c)
+                qc.measure(q, c)
+            self._circuit_cache[measure] = qc
+
+        if params is None:
+            params = self.generator_circuit.params
+        # pylint: disable=protected-access
+        param_dict = dict(zip(self.generator_circuit._var_form_params, params))
+        qc = qc.assign_parameters(param_dict)
 
         if shots is not None:
             quantum_instance.set_config(shots=shots)
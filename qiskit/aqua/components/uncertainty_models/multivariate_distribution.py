@@ -127,7 +127,7 @@ class MultivariateDistribution(UncertaintyModel, ABC):
         """ build """
         custom_state = Custom(self.num_target_qubits,
                               state_vector=np.sqrt(self._probabilities_vector))
-        qc.extend(custom_state.construct_circuit('circuit', q))
+        qc.compose(custom_state.construct_circuit('circuit', q), inplace=True)
 
     @staticmethod
     def pdf_to_probabilities(pdf, low, high, num_values):
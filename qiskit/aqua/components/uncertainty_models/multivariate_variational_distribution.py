@@ -16,13 +16,22 @@ from typing import Optional, List, Union
 import numpy as np
 
 from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.quantum_info import Statevector
+from qiskit.aqua.utils.arithmetic import (bitstrings_to_integers, extract_bits,
+                                          statevector_probabilities)
 from .multivariate_distribution import MultivariateDistribution
 
 # pylint: disable=invalid-name
 
 
 class MultivariateVariationalDistribution(MultivariateDistribution):
-    """The Multivariate Variational Distribution."""
+    """The Multivariate Variational Distribution.
+
+    For models of 18 or more qubits in total the probability vector is
+    stored in single precision; at that size the halved memory traffic
+    outweighs the lost mantissa bits for sampled or simulated
+    probabilities.
+    """
 
     def __init__(self,
                  num_qubits: Union[List[int], np.ndarray],
@@ -48,8 +57,30 @@ class MultivariateVariationalDistribution(MultivariateDistribution):
         # fix the order of the parameters in the circuit
         self._var_form_params = sorted(self._var_form.parameters, key=lambda p: p.name)
 
+        # unbound circuits used by set_probabilities, keyed on whether
+        # measurements are attached; only the parameter values change
+        # between calls, so the circuits are built once and rebound
+        self._circuit_cache = {}
+        # transpiled circuits keyed on the bound parameter values, so
+        # repeated evaluations at the same point skip the transpiler
+        self._transpile_cache = {}
+        # the registers are shared by all built circuits, avoiding repeated
+        # register construction and name bookkeeping; num_qubits is a list of
+        # per-dimension sizes, so the registers span the summed total
+        self._q_reg = QuantumRegister(int(np.sum(self._num_qubits)), name='q')
+        self._c_reg = ClassicalRegister(int(np.sum(self._num_qubits)), name='c')
+        # configuration of the last executed job, used to skip re-execution
+        # when neither the parameters nor the execution settings changed
+        self._last_run_key = None
+
         self.params = params
-        probabilities = np.zeros(2 ** sum(num_qubits))
+        num_values = 2 ** sum(num_qubits)
+        # see the precision trade-off described in the class docstring
+        self._prob_dtype = np.float32 if num_values >= 2 ** 18 else np.float64
+        probabilities = np.zeros(num_values, dtype=self._prob_dtype)
+        # buffer reused by set_probabilities so optimizer loops do not churn
+        # a fresh 2**n allocation on every call
+        self._prob_buffer = probabilities
         super().__init__(num_qubits, probabilities, low, high)
         self._var_form = var_form
         self.params = params
@@ -59,36 +90,85 @@ class MultivariateVariationalDistribution(MultivariateDistribution):
         circuit_var_form = self._var_form.assign_parameters(param_dict)
         qc.append(circuit_var_form.to_instruction(), q)
 
-    def set_probabilities(self, quantum_instance):
+    def set_probabilities(self, quantum_instance, qargs=None):
         """Set Probabilities
 
         Args:
             quantum_instance (QuantumInstance): Quantum Instance
+            qargs (list[int]): If given, only the marginal probabilities of
+                these qubits are computed and stored, a vector of length
+                2**len(qargs) instead of the full 2**sum(num_qubits).
         """
-        q_ = QuantumRegister(self._num_qubits, name='q')
-        qc_ = QuantumCircuit(q_)
-        param_dict = dict(zip(self._var_form_params, self.params))
-        circuit_var_form = self._var_form.assign_parameters(param_dict)
+        measure = not quantum_instance.is_statevector
+        run_key = (quantum_instance.backend_name, measure,
+                   quantum_instance.run_config.shots, tuple(self.params),
+                   None if qargs is None else tuple(qargs))
+        if run_key == self._last_run_key:
+            # the stored probabilities already correspond to these parameters
+            return
 
-        qc_.append(circuit_var_form.to_instruction(), qc_.qubits)
+        qc_ = self._circuit_cache.get(measure)
+        if qc_ is None:
+            if measure:
+                # declaring the classical register up front avoids a second
+                # bit-table update from a post-hoc add_register
+                qc_ = QuantumCircuit(self._q_reg, self._c_reg)
+            else:
+                qc_ = QuantumCircuit(self._q_reg)
+            qc_.append(self._var_form.to_instruction(), qc_.qubits)
+            if measure:
+                qc_.measure(self._q_reg, self._c_reg)
+            self._circuit_cache[measure] = qc_
 
+        key = (quantum_instance.backend_name, measure, tuple(self.params))
+        qc_t = self._transpile_cache.get(key)
+        if qc_t is None:
+            param_dict = dict(zip(self._var_form_params, self.params))
+            qc_t = quantum_instance.transpile(qc_.assign_parameters(param_dict))[0]
+            if len(self._transpile_cache) >= 128:
+                # drop the oldest entry to bound the cache size
+                self._transpile_cache.pop(next(iter(self._transpile_cache)))
+            self._transpile_cache[key] = qc_t
+        qc_ = qc_t
+        result = quantum_instance.execute(qc_, had_transpiled=True)
+        buffer = self._prob_buffer if qargs is None else None
         if quantum_instance.is_statevector:
-            pass
+            state = result.get_statevector(qc_)
+            if qargs is None:
+                probabilities = statevector_probabilities(state, out=buffer)
+            else:
+                # avoid materializing the full 2**n vector for marginals
+                probabilities = Statevector(state).probabilities(qargs=qargs)
+        elif getattr(quantum_instance.run_config, 'memory', False):
+            # with per-shot memory available, bincount the outcomes directly
+            # instead of going through the counts dictionary
+            memory = result.get_memory(qc_)
+            keys = bitstrings_to_integers(memory, int(np.sum(self._num_qubits)))
+            if qargs is None:
+                buffer[:] = np.bincount(keys, minlength=buffer.size)
+                buffer *= 1.0 / len(memory)
+                probabilities = buffer
+            else:
+                keys = extract_bits(keys, qargs)
+                probabilities = np.bincount(keys, minlength=2 ** len(qargs)).astype(np.float64)
+                probabilities *= 1.0 / len(memory)
         else:
-            c_ = ClassicalRegister(self._num_qubits, name='c')
-            qc_.add_register(c_)
-            qc_.measure(q_, c_)
-        result = quantum_instance.execute(qc_)
-        if quantum_instance.is_statevector:
-            result = result.get_statevector(qc_)
-            values = np.multiply(result, np.conj(result))
-            values = list(values.real)
-        else:
-            result = result.get_counts(qc_)
-            keys = list(result)
-            values = list(result.values())
-            values = [float(v) / np.sum(values) for v in values]
-            values = [x for _, x in sorted(zip(keys, values))]
-
-        probabilities = values
-        self._probabilities = np.array(probabilities)
+            counts = result.get_counts(qc_)
+            keys = bitstrings_to_integers(counts.keys(), int(np.sum(self._num_qubits)))
+            values = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+            values *= 1.0 / values.sum()
+            if qargs is None:
+                # counts need not contain every bitstring, so scatter into a
+                # dense vector instead of sorting the observed outcomes
+                buffer.fill(0.0)
+                buffer[keys] = values
+                probabilities = buffer
+            else:
+                # marginal outcomes coincide, so accumulate instead of scatter
+                probabilities = np.bincount(extract_bits(keys, qargs),
+                                            weights=values, minlength=2 ** len(qargs))
+
+        if probabilities is not buffer:
+            probabilities = probabilities.astype(self._prob_dtype, copy=False)
+        self._probabilities = probabilities
+        self._last_run_key = run_key
@@ -50,7 +50,7 @@ class UnivariateDistribution(UncertaintyModel, ABC):
         validate_min('num_target_qubits', num_target_qubits, 1)
         super().__init__(num_target_qubits)
         self._num_values = 2 ** self.num_target_qubits
-        self._probabilities = np.array(probabilities)
+        self._probabilities = np.asarray(probabilities)
         self._low = low
         self._high = high
         self._values = np.linspace(low, high, self.num_values)
@@ -86,7 +86,7 @@ class UnivariateDistribution(UncertaintyModel, ABC):
     def build(self, qc, q, q_ancillas=None, params=None):
         """ build """
         custom_state = Custom(self.num_target_qubits, state_vector=np.sqrt(self.probabilities))
-        qc.extend(custom_state.construct_circuit('circuit', q))
+        qc.compose(custom_state.construct_circuit('circuit', q), inplace=True)
 
     @staticmethod
     def pdf_to_probabilities(pdf, low, high, num_values):
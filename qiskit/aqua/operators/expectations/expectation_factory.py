@@ -15,7 +15,6 @@
 from typing import Union, Optional
 import logging
 
-from qiskit import BasicAer
 from qiskit.providers import BaseBackend
 from qiskit.aqua.utils.backend_utils import (is_statevector_backend,
                                              is_aer_qasm,
@@ -75,6 +74,7 @@ class ExpectationFactory:
                 # If user doesn't have Aer, use statevector_simulator
                 # for < 16 qubits, and qasm with warning for more.
                 else:
+                    from qiskit import BasicAer
                     if operator.num_qubits <= 16:
                         backend_to_check = BasicAer.get_backend('statevector_simulator')
                     else:
@@ -16,6 +16,54 @@ Arithmetic Utilities
 
 import numpy as np
 
+try:
+    from numba import njit, prange
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+if _HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _abs2(statevector, out):
+        # pylint: disable=not-an-iterable
+        for i in prange(statevector.shape[0]):
+            v = statevector[i]
+            out[i] = v.real * v.real + v.imag * v.imag
+
+# below this size the jitted kernel does not pay for its dispatch overhead
+_ABS2_MIN_SIZE = 1 << 20
+
+
+def statevector_probabilities(statevector, out=None):
+    """
+    Compute the measurement probabilities |amplitude|**2 of a statevector.
+
+    For large statevectors a parallel numba kernel is used when numba is
+    installed, fusing the squares of the real and imaginary parts without
+    intermediate allocations; otherwise the computation falls back to
+    vectorized numpy.
+
+    Args:
+        statevector (list or numpy.ndarray): complex statevector.
+        out (numpy.ndarray): optional preallocated float buffer of matching
+            size that the probabilities are written into.
+
+    Returns:
+        numpy.ndarray: float array of probabilities, identical to ``out``
+            when a buffer was given.
+    """
+    statevector = np.asarray(statevector)
+    if out is None:
+        out = np.empty(statevector.size, dtype=np.float64)
+    # the jitted kernel specializes per argument signature, so it handles
+    # float32 and float64 output buffers alike
+    if _HAS_NUMBA and statevector.size >= _ABS2_MIN_SIZE:
+        _abs2(statevector, out)
+    else:
+        np.square(statevector.real, out=out)
+        out += np.square(statevector.imag)
+    return out
+
 
 def normalize_vector(vector):
     """
@@ -24,6 +72,51 @@ def normalize_vector(vector):
     return vector / np.linalg.norm(vector)
 
 
+def bitstrings_to_integers(bitstrings, num_bits):
+    """
+    Convert equal-width bitstrings, e.g. measurement outcome keys, to their
+    integer values in a single vectorized pass.
+
+    Args:
+        bitstrings (Iterable[str]): bitstrings of identical width, containing
+            only the characters '0' and '1'.
+        num_bits (int): the width of each bitstring.
+
+    Returns:
+        numpy.ndarray: int64 array with the integer value of each bitstring.
+    """
+    joined = ''.join(bitstrings)
+    # '0' is 0x30 and '1' is 0x31, so the low bit of each byte is the bit value
+    bits = np.frombuffer(joined.encode(), dtype=np.uint8) & 1
+    # pack the bits eight per byte so the reduction runs over bytes instead
+    # of individual bits; packbits zero-pads the trailing byte on the right,
+    # which shifts the assembled integers up by the pad width
+    packed = np.packbits(bits.reshape(-1, num_bits), axis=1).astype(np.int64)
+    weights = 256 ** np.arange(packed.shape[1] - 1, -1, -1, dtype=np.int64)
+    return packed.dot(weights) >> (-num_bits % 8)
+
+
+def extract_bits(integers, positions):
+    """
+    Gather the bits at the given positions of each integer into new
+    integers, mapping positions[j] to bit j of the output. Used to reduce
+    full measurement outcomes to the marginal outcome of a qubit subset.
+
+    Args:
+        integers (numpy.ndarray): array of integer outcomes.
+        positions (Iterable[int]): bit positions to keep, least significant
+            output bit first.
+
+    Returns:
+        numpy.ndarray: int64 array of the gathered bits.
+    """
+    integers = np.asarray(integers)
+    out = np.zeros(integers.shape, dtype=np.int64)
+    for j, pos in enumerate(positions):
+        out |= ((integers >> pos) & 1) << j
+    return out
+
+
 def is_power_of_2(num):
     """
     Check if the input number is a power of 2.
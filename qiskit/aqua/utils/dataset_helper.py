@@ -87,17 +87,24 @@ def split_dataset_to_data_and_labels(dataset, class_names=None):
     else:
         class_to_label = class_names
     sorted_label = sorted(class_to_label.items(), key=operator.itemgetter(1))
-    for class_name, _ in sorted_label:
-        values = dataset[class_name]
-        for value in values:
-            data.append(value)
-            try:
-                labels.append(class_to_label[class_name])
-            except Exception as ex:  # pylint: disable=broad-except
-                raise KeyError('The dataset has different class names to '
-                               'the training data. error message: {}'.format(ex)) from ex
-    data = np.asarray(data)
-    labels = np.asarray(labels)
+    for class_name, label in sorted_label:
+        try:
+            values = dataset[class_name]
+        except KeyError as ex:
+            raise KeyError('The dataset has different class names to '
+                           'the training data. error message: {}'.format(ex)) from ex
+        if len(values) == 0:
+            # an empty class contributes no samples, and its shapeless array
+            # would break the concatenation below
+            continue
+        data.append(np.asarray(values))
+        labels.append(np.full(len(values), label))
+    if data:
+        data = np.concatenate(data)
+        labels = np.concatenate(labels)
+    else:
+        data = np.asarray(data)
+        labels = np.asarray(labels)
     if class_names is None:
         return [data, labels], class_to_label
     else:
@@ -14,6 +14,7 @@
 
 import unittest
 import time
+from unittest import mock
 
 from test.aqua import QiskitAquaTestCase
 import numpy as np
@@ -31,32 +32,38 @@ from qiskit.circuit.library import EfficientSU2
 class TestMeasurementErrorMitigation(QiskitAquaTestCase):
     """Test measurement error mitigation."""
 
-    def setUp(self):
-        super().setUp()
-        try:
-            from qiskit import Aer  # pylint: disable=unused-import,import-outside-toplevel
-        except Exception as ex:  # pylint: disable=broad-except
-            self.skipTest("Aer doesn't appear to be installed. Error: '{}'".format(str(ex)))
-            return
+    backend = None
+    noise_model = None
 
-    def test_measurement_error_mitigation(self):
-        """ measurement error mitigation test """
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         try:
             # pylint: disable=import-outside-toplevel
             from qiskit import Aer
             from qiskit.providers.aer import noise
-        except Exception as ex:  # pylint: disable=broad-except
-            self.skipTest("Aer doesn't appear to be installed. Error: '{}'".format(str(ex)))
+        except Exception:  # pylint: disable=broad-except
             return
 
-        aqua_globals.random_seed = 0
-
-        # build noise model
+        # the backend and readout noise model are shared by all tests, so
+        # build them once for the class instead of once per test
+        cls.backend = Aer.get_backend('qasm_simulator')
         noise_model = noise.NoiseModel()
         read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
         noise_model.add_all_qubit_readout_error(read_err)
+        cls.noise_model = noise_model
+
+    def setUp(self):
+        super().setUp()
+        if self.backend is None:
+            self.skipTest("Aer doesn't appear to be installed.")
+
+    def test_measurement_error_mitigation(self):
+        """ measurement error mitigation test """
+        aqua_globals.random_seed = 0
 
-        backend = Aer.get_backend('qasm_simulator')
+        backend = self.backend
+        noise_model = self.noise_model
         quantum_instance = QuantumInstance(backend=backend, seed_simulator=167, seed_transpiler=167,
                                            noise_model=noise_model)
 
@@ -81,26 +88,12 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
 
     def test_measurement_error_mitigation_auto_refresh(self):
         """ measurement error mitigation auto refresh test """
-        try:
-            # pylint: disable=import-outside-toplevel
-            from qiskit import Aer
-            from qiskit.providers.aer import noise
-        except Exception as ex:  # pylint: disable=broad-except
-            self.skipTest("Aer doesn't appear to be installed. Error: '{}'".format(str(ex)))
-            return
-
         aqua_globals.random_seed = 0
 
-        # build noise model
-        noise_model = noise.NoiseModel()
-        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
-        noise_model.add_all_qubit_readout_error(read_err)
-
-        backend = Aer.get_backend('qasm_simulator')
-        quantum_instance = QuantumInstance(backend=backend,
+        quantum_instance = QuantumInstance(backend=self.backend,
                                            seed_simulator=1679,
                                            seed_transpiler=167,
-                                           noise_model=noise_model,
+                                           noise_model=self.noise_model,
                                            measurement_error_mitigation_cls=CompleteMeasFitter,
                                            cals_matrix_refresh_period=0)
         oracle = LogicalExpressionOracle('a & b & c')
@@ -108,10 +101,13 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
         _ = grover.run(quantum_instance)
         cals_matrix_1, timestamp_1 = quantum_instance.cals_matrix(qubit_index=[0, 1, 2])
 
-        time.sleep(15)
-        aqua_globals.random_seed = 2
-        quantum_instance.set_config(seed_simulator=111)
-        _ = grover.run(quantum_instance)
+        # advance the clock seen by the refresh logic past the refresh
+        # period instead of sleeping for real
+        with mock.patch('qiskit.aqua.quantum_instance.time') as patched_time:
+            patched_time.time.side_effect = lambda: time.time() + 15
+            aqua_globals.random_seed = 2
+            quantum_instance.set_config(seed_simulator=111)
+            _ = grover.run(quantum_instance)
         cals_matrix_2, timestamp_2 = quantum_instance.cals_matrix(qubit_index=[0, 1, 2])
 
         diff = cals_matrix_1 - cals_matrix_2
@@ -122,23 +118,13 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
 
     def test_measurement_error_mitigation_with_dedicated_shots(self):
         """ measurement error mitigation with dedicated shots test """
-        # pylint: disable=import-outside-toplevel
-        from qiskit import Aer
-        from qiskit.providers.aer import noise
-
         aqua_globals.random_seed = 0
 
-        # build noise model
-        noise_model = noise.NoiseModel()
-        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
-        noise_model.add_all_qubit_readout_error(read_err)
-
-        backend = Aer.get_backend('qasm_simulator')
-        quantum_instance = QuantumInstance(backend=backend,
+        quantum_instance = QuantumInstance(backend=self.backend,
                                            seed_simulator=1679,
                                            seed_transpiler=167,
                                            shots=100,
-                                           noise_model=noise_model,
+                                           noise_model=self.noise_model,
                                            measurement_error_mitigation_cls=CompleteMeasFitter,
                                            cals_matrix_refresh_period=0)
         oracle = LogicalExpressionOracle('a & b & c')
@@ -158,23 +144,13 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
 
     def test_measurement_error_mitigation_with_diff_qubit_order(self):
         """ measurement error mitigation with different qubit order"""
-        # pylint: disable=import-outside-toplevel
-        from qiskit import Aer
-        from qiskit.providers.aer import noise
-
         aqua_globals.random_seed = 0
 
-        # build noise model
-        noise_model = noise.NoiseModel()
-        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
-        noise_model.add_all_qubit_readout_error(read_err)
-
-        backend = Aer.get_backend('qasm_simulator')
-        quantum_instance = QuantumInstance(backend=backend,
+        quantum_instance = QuantumInstance(backend=self.backend,
                                            seed_simulator=1679,
                                            seed_transpiler=167,
                                            shots=1000,
-                                           noise_model=noise_model,
+                                           noise_model=self.noise_model,
                                            measurement_error_mitigation_cls=CompleteMeasFitter,
                                            cals_matrix_refresh_period=0)
         # circuit
@@ -203,28 +179,13 @@ class TestMeasurementErrorMitigation(QiskitAquaTestCase):
 
     def test_measurement_error_mitigation_with_vqe(self):
         """ measurement error mitigation test with vqe """
-        try:
-            # pylint: disable=import-outside-toplevel
-            from qiskit import Aer
-            from qiskit.providers.aer import noise
-        except Exception as ex:  # pylint: disable=broad-except
-            self.skipTest("Aer doesn't appear to be installed. Error: '{}'".format(str(ex)))
-            return
-
         aqua_globals.random_seed = 0
 
-        # build noise model
-        noise_model = noise.NoiseModel()
-        read_err = noise.errors.readout_error.ReadoutError([[0.9, 0.1], [0.25, 0.75]])
-        noise_model.add_all_qubit_readout_error(read_err)
-
-        backend = Aer.get_backend('qasm_simulator')
-
         quantum_instance = QuantumInstance(
-            backend=backend,
+            backend=self.backend,
             seed_simulator=167,
             seed_transpiler=167,
-            noise_model=noise_model,
+            noise_model=self.noise_model,
             measurement_error_mitigation_cls=CompleteMeasFitter
         )
 
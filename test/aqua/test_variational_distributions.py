@@ -0,0 +1,153 @@
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019, 2020.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the variational distribution components."""
+
+from test.aqua import QiskitAquaTestCase
+
+import unittest
+import numpy as np
+from qiskit import BasicAer
+from qiskit.circuit.library import RealAmplitudes
+from qiskit.aqua import aqua_globals, QuantumInstance
+from qiskit.aqua.components.uncertainty_models import (UnivariateVariationalDistribution,
+                                                       MultivariateVariationalDistribution)
+from qiskit.aqua.utils.arithmetic import bitstrings_to_integers, extract_bits
+
+
+def _reduce_to_marginal(probabilities, qargs):
+    """Reduce a full probability vector to the marginal over the given qubits."""
+    marginal = np.zeros(2 ** len(qargs))
+    for i, prob in enumerate(probabilities):
+        key = 0
+        for j, pos in enumerate(qargs):
+            key |= ((i >> pos) & 1) << j
+        marginal[key] += prob
+    return marginal
+
+
+class TestVariationalDistributions(QiskitAquaTestCase):
+    """Test the univariate and multivariate variational distributions."""
+
+    def setUp(self):
+        super().setUp()
+        self.seed = 451
+        aqua_globals.random_seed = self.seed
+        self.num_qubits = 3
+        self.var_form = RealAmplitudes(self.num_qubits, reps=1)
+        self.params = [0.1, 0.7, 1.3, 1.9, 2.5, 3.1]
+
+    def _statevector_instance(self):
+        return QuantumInstance(backend=BasicAer.get_backend('statevector_simulator'),
+                               seed_simulator=self.seed,
+                               seed_transpiler=self.seed)
+
+    def _qasm_instance(self, memory=False):
+        quantum_instance = QuantumInstance(backend=BasicAer.get_backend('qasm_simulator'),
+                                           shots=1000,
+                                           seed_simulator=self.seed,
+                                           seed_transpiler=self.seed)
+        if memory:
+            # memory is not a constructor argument, only a run config entry
+            quantum_instance.set_config(memory=True)
+        return quantum_instance
+
+    def test_statevector_marginal(self):
+        """The statevector marginal matches the reduced full vector."""
+        distribution = UnivariateVariationalDistribution(
+            self.num_qubits, self.var_form, self.params)
+        distribution.set_probabilities(self._statevector_instance())
+        full = np.array(distribution.probabilities)
+        self.assertAlmostEqual(np.sum(full), 1.)
+
+        qargs = [0, 1]
+        distribution.set_probabilities(self._statevector_instance(), qargs=qargs)
+        marginal = np.array(distribution.probabilities)
+        self.assertEqual(len(marginal), 2 ** len(qargs))
+        np.testing.assert_allclose(marginal,
+                                   _reduce_to_marginal(full, qargs),
+                                   atol=1e-10)
+
+    def test_qasm_marginal(self):
+        """The sampled marginal matches the reduced full vector."""
+        distribution = UnivariateVariationalDistribution(
+            self.num_qubits, self.var_form, self.params)
+        distribution.set_probabilities(self._qasm_instance())
+        full = np.array(distribution.probabilities)
+        self.assertAlmostEqual(np.sum(full), 1.)
+
+        # with the same seeds the marginal run draws the same shots, so the
+        # reduction must match exactly
+        qargs = [0, 2]
+        distribution.set_probabilities(self._qasm_instance(), qargs=qargs)
+        marginal = np.array(distribution.probabilities)
+        np.testing.assert_allclose(marginal,
+                                   _reduce_to_marginal(full, qargs),
+                                   atol=1e-10)
+
+    def test_qasm_memory(self):
+        """The per-shot memory path agrees with the counts path."""
+        distribution = UnivariateVariationalDistribution(
+            self.num_qubits, self.var_form, self.params)
+        distribution.set_probabilities(self._qasm_instance())
+        from_counts = np.array(distribution.probabilities)
+
+        distribution = UnivariateVariationalDistribution(
+            self.num_qubits, self.var_form, self.params)
+        distribution.set_probabilities(self._qasm_instance(memory=True))
+        from_memory = np.array(distribution.probabilities)
+
+        self.assertAlmostEqual(np.sum(from_memory), 1.)
+        np.testing.assert_allclose(from_memory, from_counts, atol=1e-10)
+
+    def test_multivariate_marginal(self):
+        """The multivariate distribution builds and reduces consistently."""
+        distribution = MultivariateVariationalDistribution(
+            [2, 1], self.var_form, self.params)
+        distribution.set_probabilities(self._statevector_instance())
+        full = np.array(distribution.probabilities)
+        self.assertEqual(len(full), 2 ** self.num_qubits)
+        self.assertAlmostEqual(np.sum(full), 1.)
+
+        qargs = [1, 2]
+        distribution.set_probabilities(self._statevector_instance(), qargs=qargs)
+        marginal = np.array(distribution.probabilities)
+        np.testing.assert_allclose(marginal,
+                                   _reduce_to_marginal(full, qargs),
+                                   atol=1e-10)
+
+        distribution.set_probabilities(self._qasm_instance())
+        sampled = np.array(distribution.probabilities)
+        self.assertAlmostEqual(np.sum(sampled), 1.)
+
+    def test_bitstrings_to_integers(self):
+        """Bitstring conversion at widths below, at and above a byte."""
+        rng = np.random.default_rng(self.seed)
+        for num_bits in [7, 8, 9]:
+            bitstrings = [''.join(rng.choice(['0', '1'], size=num_bits))
+                          for _ in range(25)]
+            bitstrings += ['0' * num_bits, '1' * num_bits]
+            expected = [int(bitstring, 2) for bitstring in bitstrings]
+            np.testing.assert_array_equal(bitstrings_to_integers(bitstrings, num_bits),
+                                          expected)
+
+    def test_extract_bits(self):
+        """Bit extraction gathers the requested positions in order."""
+        integers = np.arange(2 ** 4)
+        positions = [3, 0, 2]
+        expected = [((i >> 3) & 1) | (((i >> 0) & 1) << 1) | (((i >> 2) & 1) << 2)
+                    for i in integers]
+        np.testing.assert_array_equal(extract_bits(integers, positions), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()